@@ -2,6 +2,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 from .metapost import MetaPost, MetaPostError
 from markdown.extensions.extra import ExtraExtension
+from array import array
 from typing import Any, List
 import json
 import os
@@ -9,6 +10,9 @@ import os
 
 class MetaPostReader(object):
 
+    _COLUMN_TYPECODES = {"int": "q", "float": "d", "bool": "B"}
+    _COLUMN_FILL_VALUES = {"int": 0, "float": 0.0, "bool": False}
+
     def __init__(self):
         self.mtp_list = []
         self.meta_configs = []
@@ -57,8 +61,31 @@ class MetaPostReader(object):
             raise MetaPostReaderError("Fail to parse MetaPost, filepath:{}".format(mtp.filepath))
         return result
 
+    def to_columns(self, as_numpy: bool = False) -> dict:
+        # one column per configured meta key, rows follow the order of mtp_list
+        result = dict()
+        for cfg in self.meta_configs:
+            key, datatype = cfg["key"], cfg["datatype"]
+            if datatype in self._COLUMN_TYPECODES:
+                values = array(self._COLUMN_TYPECODES[datatype])
+            else:
+                values = []
+            result[key] = {"datatype": datatype, "values": values, "mask": array("B")}
+        # fill columns post by post instead of keeping every meta dict alive
+        for mtp in self.mtp_list:
+            try:
+                meta = mtp.to_meta(self.meta_configs, self.strict_mode)
+            except MetaPostError:
+                raise MetaPostReaderError("Fail to parse MetaPost, filepath:{}".format(mtp.filepath))
+            for key, column in result.items():
+                self._append_to_column(column, key, meta)
+        if as_numpy is True:
+            self._columns_to_numpy(result)
+        return result
+
     def add_meta_cfg(self, key: str, datatype: str = "str", required: bool = True, df_val: Any = None) -> None:
-        datatype = datatype if datatype in ("bool", "int", "float", "str") else "str"
+        datatype = datatype if datatype in ("bool", "int", "float", "str", "json") else "str"
+        df_val = self._cast_df_val(df_val, datatype)
         to_append = {"key": str(key), "datatype": datatype, "required": bool(required), "df_val": df_val}
         self.meta_configs.append(to_append)
 
@@ -74,6 +101,59 @@ class MetaPostReader(object):
         else:
             self.mtp_list = self.mtp_list[-reserve_latest:]
 
+    @staticmethod
+    def _cast_df_val(df_val: Any, datatype: str) -> Any:
+        # default values are cast like the metas they stand in for
+        if df_val is None:
+            return None
+        try:
+            if isinstance(df_val, str):
+                return MetaPost._type_cast(df_val, datatype)
+            if datatype == "bool" and df_val in (True, False):
+                return bool(df_val)
+            elif datatype == "int" and not isinstance(df_val, bool) and int(df_val) == df_val:
+                return int(df_val)
+            elif datatype == "float" and not isinstance(df_val, bool):
+                return float(df_val)
+            elif datatype == "str":
+                return str(df_val)
+            elif datatype == "json":
+                return df_val
+        except (MetaPostError, ValueError, TypeError, OverflowError):
+            pass
+        raise MetaPostReaderError("MTPReaderError: unable to cast df_val {!r} to {}".format(df_val, datatype))
+
+    @classmethod
+    def _append_to_column(cls, column: dict, key: str, meta: dict) -> None:
+        # missing values are masked with 1 and filled with a placeholder
+        missing = key not in meta
+        column["mask"].append(1 if missing else 0)
+        if isinstance(column["values"], list):
+            column["values"].append(None if missing else meta[key])
+            return
+        val = cls._COLUMN_FILL_VALUES[column["datatype"]] if missing else meta[key]
+        try:
+            if column["datatype"] == "bool" and val not in (True, False):
+                raise TypeError()
+            column["values"].append(val)
+        except (OverflowError, TypeError):
+            column["mask"].pop()
+            raise MetaPostReaderError("MTPReaderError: unable to pack meta:{} value {!r} as {}"
+                                      .format(key, val, column["datatype"]))
+
+    @staticmethod
+    def _columns_to_numpy(columns: dict) -> None:
+        try:
+            import numpy
+        except ImportError:
+            raise MetaPostReaderError("MTPReaderError: numpy is required when as_numpy is True")
+        # typed columns share memory with their array buffers, str/json columns stay as lists
+        dtypes = {"int": numpy.int64, "float": numpy.float64, "bool": numpy.bool_}
+        for column in columns.values():
+            column["mask"] = numpy.frombuffer(column["mask"], dtype=numpy.bool_)
+            if column["datatype"] in dtypes:
+                column["values"] = numpy.frombuffer(column["values"], dtype=dtypes[column["datatype"]])
+
     @staticmethod
     def _list_markdown_files(dirpath: str, walk: bool = False) -> list:
         if os.path.isdir(dirpath) is False:
@@ -26,5 +26,8 @@ setuptools.setup(
         "re",
         "typing",
         "tzlocal"
-    ]
+    ],
+    extras_require={
+        "numpy": ["numpy"]
+    }
 )
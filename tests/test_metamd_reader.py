@@ -1,7 +1,13 @@
 import json
+from array import array
 from metapost import MetaPostReader, MetaPostReaderError, MetaPost, MetaPostError
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, skipIf, skipUnless
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestMetapostReader(TestCase):
@@ -76,6 +82,33 @@ class TestMetapostReader(TestCase):
         act = mtpr.meta_configs
         self.assertEqual(exp, act)
 
+    def test_ok_add_meta_cfg_cast_df_val(self):
+        mtpr = MetaPostReader()
+        mtpr.add_meta_cfg("ranking", "int", False, 2.0)
+        mtpr.add_meta_cfg("on_top", "bool", False, "yes")
+        mtpr.add_meta_cfg("work_hours", "float", False, "35.6")
+        mtpr.read_text("```key:val``` some content")
+        exp = [2, True, 35.6]
+        act = [cfg["df_val"] for cfg in mtpr.meta_configs]
+        self.assertEqual(exp, act)
+        # both exports see the same default values
+        meta = mtpr.to_meta()[0]
+        columns = mtpr.to_columns()
+        self.assertEqual([2, True, 35.6], [meta["ranking"], meta["on_top"], meta["work_hours"]])
+        self.assertEqual(array("q", [2]), columns["ranking"]["values"])
+        self.assertEqual(array("B", [1]), columns["on_top"]["values"])
+        self.assertEqual(array("d", [35.6]), columns["work_hours"]["values"])
+
+    def test_raise_add_meta_cfg(self):
+        mtpr = MetaPostReader()
+        with self.assertRaises(MetaPostReaderError):
+            mtpr.add_meta_cfg("ranking", "int", False, "undefined")
+        with self.assertRaises(MetaPostReaderError):
+            mtpr.add_meta_cfg("ranking", "int", False, 2.5)
+        with self.assertRaises(MetaPostReaderError):
+            mtpr.add_meta_cfg("on_top", "bool", False, 2)
+        self.assertEqual([], mtpr.meta_configs)
+
     def test_raise_to_meta(self):
         path = Path.cwd().joinpath("mocks/post_1.md")
         mtpr = MetaPostReader()
@@ -111,6 +144,90 @@ class TestMetapostReader(TestCase):
         act4 = mtpr.to_dict()
         self.assertEqual(exp4, act4)
 
+    def test_ok_to_columns(self):
+        mtpr = MetaPostReader()
+        mtpr.add_meta_cfg("title", "str", True)
+        mtpr.add_meta_cfg("ranking", "int", False)
+        mtpr.add_meta_cfg("work_hours", "float", False, 1.5)
+        mtpr.add_meta_cfg("on_top", "bool", False)
+        mtpr.read_text("```title:Post A\nranking:35\nwork_hours:2.5\non_top:yes``` some content")
+        mtpr.read_text("```title:Post B\non_top:no``` some content")
+        mtpr.read_text("```title:Post C\nranking:-7``` some content")
+        act = mtpr.to_columns()
+        self.assertEqual(["title", "ranking", "work_hours", "on_top"], list(act))
+        # str column
+        self.assertEqual({"datatype": "str", "values": ["Post A", "Post B", "Post C"], "mask": array("B", [0, 0, 0])},
+                         act["title"])
+        # int column with missing value
+        self.assertEqual({"datatype": "int", "values": array("q", [35, 0, -7]), "mask": array("B", [0, 1, 0])},
+                         act["ranking"])
+        # float column falls back to df_val
+        self.assertEqual({"datatype": "float", "values": array("d", [2.5, 1.5, 1.5]),
+                          "mask": array("B", [0, 0, 0])},
+                         act["work_hours"])
+        # bool column
+        self.assertEqual({"datatype": "bool", "values": array("B", [1, 0, 0]), "mask": array("B", [0, 0, 1])},
+                         act["on_top"])
+        # json column
+        mtpr = MetaPostReader()
+        mtpr.add_meta_cfg("keywords", "json", False)
+        mtpr.read_text('```keywords: ["markdown", "meta"]``` some content')
+        mtpr.read_text("```key:val``` some content")
+        act = mtpr.to_columns()
+        self.assertEqual({"datatype": "json", "values": [["markdown", "meta"], None], "mask": array("B", [0, 1])},
+                         act["keywords"])
+
+    def test_ok_to_columns_without_post(self):
+        mtpr = MetaPostReader()
+        mtpr.add_meta_cfg("title", "str", True)
+        mtpr.add_meta_cfg("ranking", "int", False)
+        exp = {"title": {"datatype": "str", "values": [], "mask": array("B")},
+               "ranking": {"datatype": "int", "values": array("q"), "mask": array("B")}}
+        act = mtpr.to_columns()
+        self.assertEqual(exp, act)
+
+    def test_raise_to_columns(self):
+        # missing required key
+        mtpr = MetaPostReader()
+        mtpr.add_meta_cfg("title", "str", True)
+        mtpr.read_text("```key:val``` some content")
+        with self.assertRaises(MetaPostReaderError):
+            mtpr.to_columns()
+        # bool column only takes True or False
+        column = {"datatype": "bool", "values": array("B"), "mask": array("B")}
+        with self.assertRaises(MetaPostReaderError):
+            MetaPostReader._append_to_column(column, "on_top", {"on_top": 2})
+        self.assertEqual({"datatype": "bool", "values": array("B"), "mask": array("B")}, column)
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_ok_to_columns_as_numpy(self):
+        mtpr = MetaPostReader()
+        mtpr.add_meta_cfg("title", "str", True)
+        mtpr.add_meta_cfg("ranking", "int", False)
+        mtpr.add_meta_cfg("on_top", "bool", False)
+        mtpr.read_text("```title:Post A\nranking:35\non_top:true``` some content")
+        mtpr.read_text("```title:Post B``` some content")
+        act = mtpr.to_columns(as_numpy=True)
+        self.assertEqual(["Post A", "Post B"], act["title"]["values"])
+        self.assertEqual(numpy.int64, act["ranking"]["values"].dtype)
+        self.assertEqual([35, 0], act["ranking"]["values"].tolist())
+        self.assertEqual([False, True], act["ranking"]["mask"].tolist())
+        self.assertEqual([True, False], act["on_top"]["values"].tolist())
+        # no post read
+        mtpr._reset_mtp_list()
+        act = mtpr.to_columns(as_numpy=True)
+        self.assertEqual([], act["title"]["values"])
+        self.assertEqual((numpy.int64, 0), (act["ranking"]["values"].dtype, act["ranking"]["values"].size))
+        self.assertEqual((numpy.bool_, 0), (act["on_top"]["values"].dtype, act["on_top"]["values"].size))
+        self.assertEqual((numpy.bool_, 0), (act["ranking"]["mask"].dtype, act["ranking"]["mask"].size))
+
+    @skipUnless(numpy is None, "numpy is installed")
+    def test_raise_to_columns_as_numpy(self):
+        mtpr = MetaPostReader()
+        mtpr.read_text("```key:val``` some content")
+        with self.assertRaises(MetaPostReaderError):
+            mtpr.to_columns(as_numpy=True)
+
     def test_ok_reset_target_mtp_list(self):
         mtpr = MetaPostReader()
         mtpr.read_text("```key:val``` some content", reset=False)